@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Agent Rule Engine
+
+Compatibility and quality checks for agent configurations, written as rules
+that declare the config paths they inspect. The engine walks each config once,
+only descending into subtrees some rule cares about, and hands every matching
+value to its rules.
+
+Paths are dotted and may use `*` to match any mapping key or list item, e.g.
+`agent.core.system_prompt` or `agent.platforms.*`. A rule whose path is absent
+from the config is called once with value None, so "missing field" checks
+are ordinary rules.
+
+Custom rules live in any Python file loaded with `load_rule_file()` (or the
+validator's `--rules` option):
+
+    from agent_rules import rule
+
+    @rule('require-license', 'agent.metadata.license', kind='quality')
+    def require_license(value, path):
+        if not value:
+            yield "Consider adding a license in metadata"
+"""
+
+import importlib.util
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from convert_agent import (
+    PLATFORM_LIMITS,
+    build_chatgpt_fields,
+    build_claude_instructions,
+    build_github_copilot_instructions,
+)
+
+COMPATIBILITY = 'compatibility'
+QUALITY = 'quality'
+
+PLATFORM_NAMES = {
+    'github-copilot': 'GitHub Copilot',
+    'chatgpt': 'ChatGPT',
+    'claude-projects': 'Claude Projects',
+    'open-webui': 'Open WebUI',
+    'vscode-copilot': 'VS Code Copilot Chat',
+    'm365-copilot': 'M365 Copilot',
+}
+
+Path = Tuple[str, ...]
+Check = Callable[[Any, Path], Optional[Iterable[str]]]
+
+class Rule:
+    """A named check over one or more config paths."""
+
+    def __init__(self, name: str, paths: Iterable[str], check: Check, kind: str = COMPATIBILITY):
+        self.name = name
+        self.paths = [tuple(path.split('.')) for path in paths]
+        self.check = check
+        self.kind = kind
+
+    def __repr__(self):
+        return f"Rule({self.name!r}, kind={self.kind!r})"
+
+RULES: List[Rule] = []
+
+def rule(name: str, *paths: str, kind: str = COMPATIBILITY):
+    """Decorator registering a check function as a rule in the default registry."""
+    def register(check: Check) -> Check:
+        RULES.append(Rule(name, paths, check, kind))
+        return check
+    return register
+
+def load_rule_file(file_path: str):
+    """Import a Python file of custom rules so its @rule decorators register them."""
+    spec = importlib.util.spec_from_file_location(f"agent_rules_custom_{len(RULES)}", file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load rules from {file_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+class RuleEngine:
+    """Runs a set of rules over agent configs in a single traversal per config."""
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None):
+        self.rules = list(RULES if rules is None else rules)
+        self.timings: Dict[str, float] = defaultdict(float)
+
+        # Trie of path segments; each node is (children, [(rule, pattern), ...])
+        self._trie: Tuple[Dict[str, Any], list] = ({}, [])
+        for rule_ in self.rules:
+            for pattern in rule_.paths:
+                node = self._trie
+                for segment in pattern:
+                    node = node[0].setdefault(segment, ({}, []))
+                node[1].append((rule_, pattern))
+
+    def _walk(self, value: Any, path: Path, nodes: list, matches: list):
+        """Descend into `value` along every trie node that can still match."""
+        for children, rules in nodes:
+            for rule_, pattern in rules:
+                matches.append((rule_, pattern, value, path))
+
+        if isinstance(value, dict):
+            items = ((str(key), item) for key, item in value.items())
+        elif isinstance(value, list):
+            items = ((str(index), item) for index, item in enumerate(value))
+        else:
+            return
+
+        for key, item in items:
+            next_nodes = []
+            for children, _ in nodes:
+                if key in children:
+                    next_nodes.append(children[key])
+                if '*' in children:
+                    next_nodes.append(children['*'])
+            if next_nodes:
+                self._walk(item, path + (key,), next_nodes, matches)
+
+    def run(self, agent_config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Run all rules against one config, returning messages grouped by rule kind."""
+        matches = []
+        self._walk(agent_config, (), [self._trie], matches)
+
+        seen = {(id(rule_), pattern) for rule_, pattern, _, _ in matches}
+        for rule_ in self.rules:
+            for pattern in rule_.paths:
+                if (id(rule_), pattern) not in seen:
+                    matches.append((rule_, pattern, None, pattern))
+
+        # Report in rule registration order regardless of traversal order
+        order = {id(rule_): index for index, rule_ in enumerate(self.rules)}
+        matches.sort(key=lambda match: order[id(match[0])])
+
+        results: Dict[str, List[str]] = defaultdict(list)
+        for rule_, _, value, path in matches:
+            start = time.perf_counter()
+            messages = list(rule_.check(value, path) or [])
+            self.timings[rule_.name] += time.perf_counter() - start
+            results[rule_.kind].extend(messages)
+        return results
+
+# --- Compatibility rules: derived from the converters' own limits ---
+
+@rule('truncated-text', 'agent.core.system_prompt', 'agent.core.output_format')
+def truncated_text(value, path):
+    field = path[-1]
+    if not isinstance(value, str):
+        return
+    for platform, limits in PLATFORM_LIMITS.items():
+        if field in limits and len(value) > limits[field]:
+            yield (f"{PLATFORM_NAMES[platform]}: {field} will be truncated to "
+                   f"{limits[field]} chars ({len(value)} chars)")
+
+@rule('truncated-list', 'agent.core.expertise', 'agent.core.constraints')
+def truncated_list(value, path):
+    field = path[-1]
+    if not isinstance(value, list):
+        return
+    for platform, limits in PLATFORM_LIMITS.items():
+        if field in limits and len(value) > limits[field]:
+            yield (f"{PLATFORM_NAMES[platform]}: only the first {limits[field]} of "
+                   f"{len(value)} {field} entries will be included")
+
+@rule('truncated-output', 'agent')
+def truncated_output(value, path):
+    if not isinstance(value, dict):
+        return
+    agent_config = {'agent': value}
+    try:
+        outputs = {
+            'github-copilot': [build_github_copilot_instructions(agent_config)],
+            'chatgpt': list(build_chatgpt_fields(agent_config)),
+            'claude-projects': [build_claude_instructions(agent_config)],
+        }
+    except (KeyError, TypeError):
+        return  # Missing required fields are reported by schema validation
+    for platform, texts in outputs.items():
+        limits = PLATFORM_LIMITS[platform]
+        for text in texts:
+            if len(text) > limits['max_length']:
+                yield (f"{PLATFORM_NAMES[platform]}: output is {len(text)} chars and will be cut to "
+                       f"{limits['trim_length']} (limit {limits['max_length']})")
+
+@rule('enabled-platform-instructions', 'agent.platforms.*')
+def enabled_platform_instructions(value, path):
+    if isinstance(value, dict) and value.get('enabled', False) and not value.get('custom_instructions'):
+        yield f"{path[-1]}: Enabled but no custom_instructions provided"
+
+# --- Quality rules ---
+
+def _suggest_if_missing(name: str, path: str, suggestion: str):
+    @rule(name, path, kind=QUALITY)
+    def check(value, path):
+        if not value:
+            yield suggestion
+    return check
+
+_suggest_if_missing('metadata-author', 'agent.metadata.author',
+                    "Consider adding author information in metadata")
+_suggest_if_missing('metadata-tags', 'agent.metadata.tags',
+                    "Consider adding tags for better categorization")
+_suggest_if_missing('core-expertise', 'agent.core.expertise',
+                    "Consider defining expertise areas for better context")
+_suggest_if_missing('core-constraints', 'agent.core.constraints',
+                    "Consider defining constraints to guide agent behavior")
+_suggest_if_missing('examples', 'agent.examples',
+                    "Consider adding examples to demonstrate expected behavior")
+_suggest_if_missing('safety', 'agent.safety',
+                    "Consider adding safety guidelines and considerations")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Changed Agent Finder
+
+Uses git to work out which agent definitions need to be revalidated or
+reconverted since a given ref, so CI only processes what actually changed.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Directories that hold agent definitions (see project-context instructions)
+AGENT_DIRS = ('agents', 'examples')
+AGENT_SUFFIXES = ('.yaml', '.yml', '.json')
+
+# Files every agent depends on; a change to any of these invalidates all agents
+SCHEMA_DEPENDENCIES = (
+    'schemas/agent-schema.json',
+    'schemas/agent-schema.yaml',
+    'tools/validate_agent.py',
+    'tools/agent_rules.py',
+    'tools/convert_agent.py',  # PLATFORM_LIMITS drive the compatibility rules
+)
+CONVERTER_DEPENDENCIES = (
+    'tools/convert_agent.py',
+)
+
+def _git(*args: str) -> List[str]:
+    """Run a git command in the project root and return its output lines."""
+    result = subprocess.run(
+        ['git', *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return [line for line in result.stdout.splitlines() if line]
+
+def repo_path(path: str) -> Optional[str]:
+    """Return `path` relative to the project root, or None if it lies outside the repository."""
+    try:
+        return Path(path).resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        return None
+
+def changed_files(since: str) -> List[str]:
+    """List repository paths changed since `since`, including uncommitted and untracked files."""
+    files = set(_git('diff', '--name-only', since, '--'))
+    files.update(_git('ls-files', '--others', '--exclude-standard'))
+    return sorted(files)
+
+def is_agent_file(path: str) -> bool:
+    """Check whether a repository path is an agent definition.
+
+    Converted platform outputs live next to the definitions in `examples/`,
+    so JSON files only count when they carry a top-level `agent` key.
+    """
+    parts = Path(path).parts
+    if not parts or parts[0] not in AGENT_DIRS or not path.endswith(AGENT_SUFFIXES):
+        return False
+    full_path = PROJECT_ROOT / path
+    if not full_path.is_file():
+        return False
+    if path.endswith('.json'):
+        try:
+            with open(full_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return isinstance(data, dict) and 'agent' in data
+    return True
+
+def all_agent_files() -> List[str]:
+    """List every agent definition tracked in, or added to, the repository."""
+    files = set(_git('ls-files', *AGENT_DIRS))
+    files.update(_git('ls-files', '--others', '--exclude-standard', *AGENT_DIRS))
+    return sorted(path for path in files if is_agent_file(path))
+
+def agents_to_process(since: str, dependencies: Iterable[str] = SCHEMA_DEPENDENCIES) -> List[Path]:
+    """Return the agent files affected by changes since `since`.
+
+    Only the changed agent files are returned, unless one of `dependencies`
+    changed, in which case every agent in the repository is returned.
+    """
+    changed = changed_files(since)
+    if any(path in changed for path in dependencies):
+        selected = all_agent_files()
+    else:
+        selected = [path for path in changed if is_agent_file(path)]
+    return [PROJECT_ROOT / path for path in selected]
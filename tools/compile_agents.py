@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Agent Bundle Compiler
+
+Compiles every agent's rendered platform outputs into a single binary bundle
+that services can memory-map and query without parsing YAML or JSON.
+
+Bundle layout (all integers little-endian):
+
+    header   magic (8 bytes) | format version (u32) | slot count (u32) | entry count (u32) | file length (u64)
+    index    slot count x [key hash (u64) | key offset (u64) | key length (u32) | data length (u32)]
+    data     for each entry: key bytes ("<agent>\\0<platform>") followed by UTF-8 output
+
+The index is an open-addressing hash table (linear probing, power-of-two size),
+so a lookup reads a handful of slots and returns a zero-copy slice of the map.
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from convert_agent import PLATFORMS, load_agent_config, render_platform
+
+BUNDLE_MAGIC = b'CTLBNDL\x00'
+BUNDLE_VERSION = 2
+
+HEADER = struct.Struct('<8sIIIQ')
+SLOT = struct.Struct('<QQII')
+
+def _key_bytes(agent: str, platform: str) -> bytes:
+    """Encode an (agent, platform) pair as the bundle key."""
+    return f"{agent}\0{platform}".encode('utf-8')
+
+def _key_hash(key: bytes) -> int:
+    """Stable 64-bit hash of a bundle key (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+def _slot_count(entry_count: int) -> int:
+    """Smallest power of two that keeps the index at most half full."""
+    slots = 1
+    while slots < entry_count * 2:
+        slots *= 2
+    return slots
+
+def agent_name(input_file: Path) -> str:
+    """Bundle name of an agent: its definition file name without extension."""
+    return input_file.stem
+
+def render_all(input_files: List[Path], platforms: List[str] = PLATFORMS) -> Dict[Tuple[str, str], str]:
+    """Render every agent file to every platform, keyed by (agent, platform)."""
+    outputs = {}
+    sources = {}
+    for input_file in input_files:
+        name = agent_name(input_file)
+        if name in sources:
+            raise ValueError(f"Duplicate agent name '{name}': {sources[name]} and {input_file}")
+        sources[name] = input_file
+        agent_config = load_agent_config(str(input_file))
+        for platform in platforms:
+            outputs[(name, platform)] = render_platform(agent_config, platform)
+    return outputs
+
+def write_bundle(outputs: Dict[Tuple[str, str], str], output_file: str):
+    """Write rendered outputs to a bundle file, replacing it atomically."""
+    entries = sorted(outputs.items())
+    slot_count = _slot_count(len(entries))
+    slots = [SLOT.pack(0, 0, 0, 0)] * slot_count
+    data = bytearray()
+    data_start = HEADER.size + SLOT.size * slot_count
+
+    for (agent, platform), text in entries:
+        key = _key_bytes(agent, platform)
+        payload = text.encode('utf-8')
+        key_hash = _key_hash(key)
+
+        slot = key_hash & (slot_count - 1)
+        while SLOT.unpack(slots[slot])[2]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = SLOT.pack(key_hash, data_start + len(data), len(key), len(payload))
+
+        data += key
+        data += payload
+
+    tmp_file = f"{output_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, slot_count, len(entries), data_start + len(data)))
+        f.write(b''.join(slots))
+        f.write(data)
+    os.replace(tmp_file, output_file)
+
+class AgentBundle:
+    """Read-only, memory-mapped view of a compiled agent bundle.
+
+    Lookups are O(1) and return slices of the mapped file, so opening a bundle
+    costs the same regardless of how many agents it holds.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not an agent bundle")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._closed = False
+
+        magic, version, self._slot_count, self._entry_count, length = HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an agent bundle")
+        if version != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"{path} has unsupported bundle version {version}")
+        # Entries are never bounds-checked on lookup, so the whole file must be present
+        size = len(self._mmap)
+        if size != length or length < HEADER.size + SLOT.size * self._slot_count:
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt ({size} bytes, expected {length})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return self.get(*key) is not None
+
+    def close(self):
+        """Close the bundle for further lookups.
+
+        Slices returned by get() stay valid after closing; the map itself is
+        released once the last of them is garbage collected.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Callers still hold slices; they keep the mapping alive
+            pass
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("Lookup on a closed agent bundle")
+
+    def _slot(self, index: int) -> Tuple[int, int, int, int]:
+        return SLOT.unpack_from(self._mmap, HEADER.size + SLOT.size * index)
+
+    def get(self, agent: str, platform: str) -> Optional[memoryview]:
+        """Return the rendered output for (agent, platform) as a zero-copy view, or None."""
+        self._check_open()
+        key = _key_bytes(agent, platform)
+        key_hash = _key_hash(key)
+        mask = self._slot_count - 1
+
+        index = key_hash & mask
+        for _ in range(self._slot_count):
+            slot_hash, key_offset, key_len, data_len = self._slot(index)
+            if not key_len:
+                return None
+            if slot_hash == key_hash and self._view[key_offset:key_offset + key_len] == key:
+                data_offset = key_offset + key_len
+                return self._view[data_offset:data_offset + data_len]
+            index = (index + 1) & mask
+        return None
+
+    def get_text(self, agent: str, platform: str) -> Optional[str]:
+        """Return the rendered output for (agent, platform) decoded as text, or None."""
+        data = self.get(agent, platform)
+        return None if data is None else str(data, 'utf-8')
+
+    def keys(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the (agent, platform) pairs stored in the bundle."""
+        self._check_open()
+        for index in range(self._slot_count):
+            _, key_offset, key_len, _ = self._slot(index)
+            if key_len:
+                agent, platform = str(self._view[key_offset:key_offset + key_len], 'utf-8').split('\0')
+                yield agent, platform
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile agent definitions into a memory-mappable bundle')
+    parser.add_argument('input_files', nargs='*', help='Agent configuration files (default: all agents in the repository)')
+    parser.add_argument('--output', default='agents.bundle', help='Output bundle file (default: agents.bundle)')
+    parser.add_argument('--platform', action='append', choices=PLATFORMS, dest='platforms',
+                        help='Platform to include (repeatable, default: all platforms)')
+
+    args = parser.parse_args()
+
+    try:
+        if args.input_files:
+            input_files = [Path(path) for path in args.input_files]
+        else:
+            from changed_agents import PROJECT_ROOT, all_agent_files
+            input_files = [PROJECT_ROOT / path for path in all_agent_files()]
+
+        outputs = render_all(input_files, args.platforms or PLATFORMS)
+        write_bundle(outputs, args.output)
+        print(f"Compiled {len(input_files)} agents ({len(outputs)} outputs) to {args.output}")
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -20,64 +20,122 @@ def load_agent_config(file_path: str) -> Dict[str, Any]:
         else:
             return json.load(f)
 
-def convert_to_github_copilot(agent_config: Dict[str, Any]) -> str:
-    """Convert agent config to GitHub Copilot custom instructions format."""
+# Character and item limits applied by each converter. Validation rules read
+# these too, so warnings always match what a conversion actually drops.
+#   system_prompt, output_format: max chars copied from core.<field>
+#   expertise, constraints: max items copied from core.<field>
+#   max_length / trim_length: when the output exceeds max_length it is cut to trim_length
+#   examples: max agent.examples turned into M365 conversation starters
+#   conversation_starters: max platforms.m365_copilot.conversation_starters used
+#   max_starters: max conversation starters in the M365 output
+PLATFORM_LIMITS = {
+    'github-copilot': {
+        'system_prompt': 500,
+        'output_format': 300,
+        'expertise': 3,
+        'constraints': 3,
+        'max_length': 2000,
+        'trim_length': 1800,
+    },
+    'chatgpt': {
+        'system_prompt': 800,
+        'output_format': 400,
+        'expertise': 5,
+        'constraints': 3,
+        'max_length': 1500,  # per field
+        'trim_length': 1400,
+    },
+    'claude-projects': {
+        'max_length': 2000,
+        'trim_length': 1900,
+    },
+    'vscode-copilot': {
+        'system_prompt': 1000,
+        'expertise': 4,
+    },
+    'm365-copilot': {
+        'examples': 3,
+        'conversation_starters': 3,
+        'max_starters': 4,
+    },
+}
+
+def build_github_copilot_instructions(agent_config: Dict[str, Any]) -> str:
+    """Build GitHub Copilot instructions before the overall length trim."""
     agent = agent_config['agent']
     metadata = agent['metadata']
     core = agent['core']
     platform_config = agent.get('platforms', {}).get('github_copilot', {})
+    limits = PLATFORM_LIMITS['github-copilot']
     
     instructions = f"{metadata['name']} - {metadata['description']}\n\n"
-    instructions += f"ROLE: {core['system_prompt'][:500]}...\n\n"
+    instructions += f"ROLE: {core['system_prompt'][:limits['system_prompt']]}...\n\n"
     
     if 'expertise' in core:
         instructions += "EXPERTISE:\n"
-        for item in core['expertise'][:3]:  # Limit for space
+        for item in core['expertise'][:limits['expertise']]:  # Limit for space
             instructions += f"- {item}\n"
         instructions += "\n"
     
     if 'constraints' in core:
         instructions += "CONSTRAINTS:\n"
-        for item in core['constraints'][:3]:
+        for item in core['constraints'][:limits['constraints']]:
             instructions += f"- {item}\n"
         instructions += "\n"
     
     if 'output_format' in core:
-        instructions += f"OUTPUT_FORMAT:\n{core['output_format'][:300]}...\n\n"
+        instructions += f"OUTPUT_FORMAT:\n{core['output_format'][:limits['output_format']]}...\n\n"
     
     if platform_config.get('file_patterns'):
         patterns = ', '.join(platform_config['file_patterns'])
         instructions += f"ACTIVATION: This agent activates when working with {patterns}\n"
     
+    return instructions
+
+def convert_to_github_copilot(agent_config: Dict[str, Any]) -> str:
+    """Convert agent config to GitHub Copilot custom instructions format."""
+    limits = PLATFORM_LIMITS['github-copilot']
+    instructions = build_github_copilot_instructions(agent_config)
+    
     # Trim to GitHub Copilot's character limit
-    return instructions[:1800] + "..." if len(instructions) > 2000 else instructions
+    if len(instructions) > limits['max_length']:
+        return instructions[:limits['trim_length']] + "..."
+    return instructions
 
-def convert_to_chatgpt(agent_config: Dict[str, Any]) -> tuple[str, str]:
-    """Convert agent config to ChatGPT custom instructions format."""
+def build_chatgpt_fields(agent_config: Dict[str, Any]) -> tuple[str, str]:
+    """Build the two ChatGPT custom instruction fields before the length trim."""
     agent = agent_config['agent']
     metadata = agent['metadata']
     core = agent['core']
+    limits = PLATFORM_LIMITS['chatgpt']
     
     # Field 1: About you/Context
     field1 = f"I work with {metadata['name']} for {metadata['description']}\n\n"
     if 'expertise' in core:
-        field1 += "MY FOCUS AREAS: " + ", ".join(core['expertise'][:5]) + "\n"
+        field1 += "MY FOCUS AREAS: " + ", ".join(core['expertise'][:limits['expertise']]) + "\n"
     
     # Field 2: Response style
-    field2 = f"INSTRUCTIONS:\n{core['system_prompt'][:800]}...\n\n"
+    field2 = f"INSTRUCTIONS:\n{core['system_prompt'][:limits['system_prompt']]}...\n\n"
     
     if 'constraints' in core:
         field2 += "CONSTRAINTS:\n"
-        for constraint in core['constraints'][:3]:
+        for constraint in core['constraints'][:limits['constraints']]:
             field2 += f"- {constraint}\n"
         field2 += "\n"
     
     if 'output_format' in core:
-        field2 += f"OUTPUT FORMAT:\n{core['output_format'][:400]}...\n"
+        field2 += f"OUTPUT FORMAT:\n{core['output_format'][:limits['output_format']]}...\n"
+    
+    return field1, field2
+
+def convert_to_chatgpt(agent_config: Dict[str, Any]) -> tuple[str, str]:
+    """Convert agent config to ChatGPT custom instructions format."""
+    limits = PLATFORM_LIMITS['chatgpt']
+    field1, field2 = build_chatgpt_fields(agent_config)
     
     # Trim to ChatGPT's limits
-    field1 = field1[:1400] + "..." if len(field1) > 1500 else field1
-    field2 = field2[:1400] + "..." if len(field2) > 1500 else field2
+    field1 = field1[:limits['trim_length']] + "..." if len(field1) > limits['max_length'] else field1
+    field2 = field2[:limits['trim_length']] + "..." if len(field2) > limits['max_length'] else field2
     
     return field1, field2
 
@@ -120,16 +178,17 @@ def convert_to_m365_copilot(agent_config: Dict[str, Any]) -> Dict[str, Any]:
     core = agent['core']
     platform_config = agent.get('platforms', {}).get('m365_copilot', {})
     capabilities = agent.get('capabilities', {})
+    limits = PLATFORM_LIMITS['m365-copilot']
     
     # Generate conversation starters from examples or create defaults
     conversation_starters = []
     if 'examples' in agent and agent['examples']:
-        for example in agent['examples'][:3]:  # Max 3 starters
+        for example in agent['examples'][:limits['examples']]:
             conversation_starters.append({"text": example['input']})
     
     # Add custom conversation starters if provided
     if platform_config.get('conversation_starters'):
-        for starter in platform_config['conversation_starters'][:3]:
+        for starter in platform_config['conversation_starters'][:limits['conversation_starters']]:
             conversation_starters.append({"text": starter})
     
     # Default starters if none provided
@@ -146,7 +205,7 @@ def convert_to_m365_copilot(agent_config: Dict[str, Any]) -> Dict[str, Any]:
         "name": metadata['name'],
         "description": metadata['description'],
         "instructions": core['system_prompt'],
-        "conversation_starters": conversation_starters[:4],  # M365 limit
+        "conversation_starters": conversation_starters[:limits['max_starters']],
         "capabilities": {
             "web_search": {
                 "enabled": capabilities.get('can_browse_web', False)
@@ -175,6 +234,7 @@ def convert_to_vscode_copilot(agent_config: Dict[str, Any]) -> str:
     metadata = agent['metadata']
     core = agent['core']
     platform_config = agent.get('platforms', {}).get('copilot_chat', {})
+    limits = PLATFORM_LIMITS['vscode-copilot']
     
     instructions = f"{metadata['name']} Assistant\n\n"
     instructions += f"ROLE: {metadata['description']}\n\n"
@@ -186,11 +246,11 @@ def convert_to_vscode_copilot(agent_config: Dict[str, Any]) -> str:
     instructions += "- Git repository information\n"
     instructions += "- Terminal access\n\n"
     
-    instructions += f"INSTRUCTIONS:\n{core['system_prompt'][:1000]}...\n\n"
+    instructions += f"INSTRUCTIONS:\n{core['system_prompt'][:limits['system_prompt']]}...\n\n"
     
     if 'expertise' in core:
         instructions += "EXPERTISE:\n"
-        for item in core['expertise'][:4]:
+        for item in core['expertise'][:limits['expertise']]:
             instructions += f"- {item}\n"
         instructions += "\n"
     
@@ -205,8 +265,8 @@ def convert_to_vscode_copilot(agent_config: Dict[str, Any]) -> str:
     
     return instructions
 
-def convert_to_claude_projects(agent_config: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert agent config to Claude Projects format."""
+def build_claude_instructions(agent_config: Dict[str, Any]) -> str:
+    """Build Claude Projects custom instructions before the length trim."""
     agent = agent_config['agent']
     metadata = agent['metadata']
     core = agent['core']
@@ -244,9 +304,19 @@ def convert_to_claude_projects(agent_config: Dict[str, Any]) -> Dict[str, Any]:
     if platform_config.get('custom_instructions'):
         instructions += f"CLAUDE-SPECIFIC GUIDANCE:\n{platform_config['custom_instructions']}\n\n"
     
-    # Trim to Claude's character limit (~2000 chars)
-    if len(instructions) > 2000:
-        instructions = instructions[:1900] + "...\n\n[Instructions truncated due to length limits]"
+    return instructions
+
+def convert_to_claude_projects(agent_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert agent config to Claude Projects format."""
+    agent = agent_config['agent']
+    metadata = agent['metadata']
+    platform_config = agent.get('platforms', {}).get('claude_projects', {})
+    limits = PLATFORM_LIMITS['claude-projects']
+    instructions = build_claude_instructions(agent_config)
+    
+    # Trim to Claude's character limit
+    if len(instructions) > limits['max_length']:
+        instructions = instructions[:limits['trim_length']] + "...\n\n[Instructions truncated due to length limits]"
     
     # Build Claude Projects configuration
     claude_config = {
@@ -266,37 +336,85 @@ def convert_to_claude_projects(agent_config: Dict[str, Any]) -> Dict[str, Any]:
     
     return claude_config
 
+PLATFORMS = ['github-copilot', 'chatgpt', 'claude-projects', 'open-webui', 'vscode-copilot', 'm365-copilot']
+
+# File extension used when writing each platform's output to a directory
+PLATFORM_EXTENSIONS = {
+    'github-copilot': 'md',
+    'chatgpt': 'txt',
+    'claude-projects': 'json',
+    'open-webui': 'json',
+    'vscode-copilot': 'md',
+    'm365-copilot': 'json',
+}
+
+def render_platform(agent_config: Dict[str, Any], platform: str) -> str:
+    """Render an agent config to the text deployed on the given platform."""
+    if platform == 'github-copilot':
+        return convert_to_github_copilot(agent_config)
+        
+    elif platform == 'chatgpt':
+        field1, field2 = convert_to_chatgpt(agent_config)
+        return f"FIELD 1 (About You):\n{field1}\n\nFIELD 2 (Response Style):\n{field2}"
+        
+    elif platform == 'claude-projects':
+        return json.dumps(convert_to_claude_projects(agent_config), indent=2)
+        
+    elif platform == 'open-webui':
+        return json.dumps(convert_to_open_webui(agent_config), indent=2)
+        
+    elif platform == 'vscode-copilot':
+        return convert_to_vscode_copilot(agent_config)
+        
+    elif platform == 'm365-copilot':
+        return json.dumps(convert_to_m365_copilot(agent_config), indent=2)
+    
+    raise ValueError(f"Unknown platform: {platform}")
+
+def convert_changed(since: str, platform: str, output_dir: str = None):
+    """Convert only the agents changed since a git ref (all agents if the converter changed)."""
+    from changed_agents import agents_to_process, CONVERTER_DEPENDENCIES
+    
+    input_files = agents_to_process(since, CONVERTER_DEPENDENCIES)
+    if not input_files:
+        print(f"No agent changes since {since}")
+        return
+    
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+    
+    for input_file in input_files:
+        result = render_platform(load_agent_config(str(input_file)), platform)
+        if output_dir:
+            output_file = Path(output_dir) / f"{input_file.stem}-{platform}.{PLATFORM_EXTENSIONS[platform]}"
+            with open(output_file, 'w') as f:
+                f.write(result)
+            print(f"Converted configuration written to {output_file}")
+        else:
+            print(f"===== {input_file.name} =====")
+            print(result)
+
 def main():
     parser = argparse.ArgumentParser(description='Convert generic agent configs to platform-specific formats')
-    parser.add_argument('input_file', help='Input agent configuration file (YAML or JSON)')
-    parser.add_argument('--platform', choices=['github-copilot', 'chatgpt', 'claude-projects', 'open-webui', 'vscode-copilot', 'm365-copilot'], 
+    parser.add_argument('input_file', nargs='?', help='Input agent configuration file (YAML or JSON)')
+    parser.add_argument('--platform', choices=PLATFORMS, 
                        required=True, help='Target platform')
     parser.add_argument('--output', help='Output file (optional)')
+    parser.add_argument('--since', metavar='REF',
+                        help='Convert only agents changed since this git ref (all agents if the converter changed)')
+    parser.add_argument('--output-dir', help='Output directory for --since mode (optional)')
     
     args = parser.parse_args()
+    if bool(args.input_file) == bool(args.since):
+        parser.error('provide either input_file or --since')
     
     try:
-        agent_config = load_agent_config(args.input_file)
-        result = ""
+        if args.since:
+            convert_changed(args.since, args.platform, args.output_dir)
+            return
         
-        if args.platform == 'github-copilot':
-            result = convert_to_github_copilot(agent_config)
-            
-        elif args.platform == 'chatgpt':
-            field1, field2 = convert_to_chatgpt(agent_config)
-            result = f"FIELD 1 (About You):\n{field1}\n\nFIELD 2 (Response Style):\n{field2}"
-            
-        elif args.platform == 'claude-projects':
-            result = json.dumps(convert_to_claude_projects(agent_config), indent=2)
-            
-        elif args.platform == 'open-webui':
-            result = json.dumps(convert_to_open_webui(agent_config), indent=2)
-            
-        elif args.platform == 'vscode-copilot':
-            result = convert_to_vscode_copilot(agent_config)
-            
-        elif args.platform == 'm365-copilot':
-            result = json.dumps(convert_to_m365_copilot(agent_config), indent=2)
+        agent_config = load_agent_config(args.input_file)
+        result = render_platform(agent_config, args.platform)
         
         if args.output:
             with open(args.output, 'w') as f:
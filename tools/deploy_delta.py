@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Deployment Delta
+
+Compares the current rendered agent outputs with a snapshot of the last
+deployed build and reports which (agent, platform) outputs were added, removed
+or changed, with field-level diffs for JSON platforms.
+
+Comparison is hash-first: each snapshot entry records a hash of the agent
+source and the converter, so agents whose source is unchanged are not
+re-rendered, and rendered outputs are only parsed and diffed when their
+hashes differ.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from compile_agents import agent_name
+from convert_agent import PLATFORM_EXTENSIONS, PLATFORMS, load_agent_config, render_platform
+
+SNAPSHOT_VERSION = 1
+CONVERTER_FILE = Path(__file__).parent / 'convert_agent.py'
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def load_snapshot(snapshot_file: str) -> Dict[str, Any]:
+    """Load a deployment snapshot, returning an empty one if the file does not exist."""
+    if not os.path.exists(snapshot_file):
+        return {"version": SNAPSHOT_VERSION, "agents": {}}
+    with open(snapshot_file, 'r') as f:
+        snapshot = json.load(f)
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"{snapshot_file} has unsupported snapshot version {snapshot.get('version')}")
+    return snapshot
+
+def save_snapshot(snapshot: Dict[str, Any], snapshot_file: str):
+    """Write a deployment snapshot, replacing the file atomically."""
+    tmp_file = f"{snapshot_file}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(snapshot, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, snapshot_file)
+
+def build_snapshot(input_files: List[Path], previous: Dict[str, Any],
+                   platforms: List[str] = PLATFORMS) -> Dict[str, Any]:
+    """Build the snapshot of the current outputs, reusing unchanged entries from `previous`."""
+    converter_hash = _sha256(CONVERTER_FILE.read_bytes())
+    agents = {}
+    for input_file in input_files:
+        name = agent_name(input_file)
+        if name in agents:
+            raise ValueError(f"Duplicate agent name '{name}': {input_file}")
+
+        source_hash = _sha256(converter_hash.encode('utf-8') + input_file.read_bytes())
+        old_entry = previous['agents'].get(name)
+        if old_entry and old_entry['source_hash'] == source_hash and set(old_entry['outputs']) >= set(platforms):
+            agents[name] = {
+                "source_hash": source_hash,
+                "outputs": {platform: old_entry['outputs'][platform] for platform in platforms},
+            }
+            continue
+
+        agent_config = load_agent_config(str(input_file))
+        outputs = {}
+        for platform in platforms:
+            output = render_platform(agent_config, platform)
+            outputs[platform] = {"hash": _sha256(output.encode('utf-8')), "output": output}
+        agents[name] = {"source_hash": source_hash, "outputs": outputs}
+
+    return {"version": SNAPSHOT_VERSION, "agents": agents}
+
+def diff_fields(old: Any, new: Any, path: str = '') -> Dict[str, Dict[str, Any]]:
+    """Return field-level differences between two JSON values, keyed by dotted path."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = {}
+        for key in sorted(set(old) | set(new), key=str):
+            field = f"{path}.{key}" if path else str(key)
+            if key not in old:
+                changes[field] = {"new": new[key]}
+            elif key not in new:
+                changes[field] = {"old": old[key]}
+            else:
+                changes.update(diff_fields(old[key], new[key], field))
+        return changes
+    if old != new:
+        return {path: {"old": old, "new": new}}
+    return {}
+
+def compute_delta(previous: Dict[str, Any], current: Dict[str, Any], full_scan: bool = True) -> Dict[str, Any]:
+    """Compare two snapshots and return added, removed and changed (agent, platform) pairs.
+
+    With `full_scan` False, `current` covers only some agents, so agents
+    missing from it are left out of the comparison rather than reported removed.
+    """
+    delta = {"added": [], "removed": [], "changed": [], "unchanged": 0}
+    new_agents = current['agents']
+    old_agents = previous['agents']
+    if not full_scan:
+        old_agents = {name: entry for name, entry in old_agents.items() if name in new_agents}
+
+    for name in sorted(set(old_agents) | set(new_agents)):
+        old_entry = old_agents.get(name)
+        new_entry = new_agents.get(name)
+
+        # Identical source and converter means identical outputs
+        if old_entry and new_entry and old_entry['source_hash'] == new_entry['source_hash'] \
+                and old_entry['outputs'].keys() == new_entry['outputs'].keys():
+            delta['unchanged'] += len(new_entry['outputs'])
+            continue
+
+        old_outputs = old_entry['outputs'] if old_entry else {}
+        new_outputs = new_entry['outputs'] if new_entry else {}
+        for platform in sorted(set(old_outputs) | set(new_outputs)):
+            pair = {"agent": name, "platform": platform}
+            if platform not in old_outputs:
+                delta['added'].append(pair)
+            elif platform not in new_outputs:
+                delta['removed'].append(pair)
+            elif old_outputs[platform]['hash'] == new_outputs[platform]['hash']:
+                delta['unchanged'] += 1
+            else:
+                if PLATFORM_EXTENSIONS.get(platform) == 'json':
+                    pair['fields'] = diff_fields(json.loads(old_outputs[platform]['output']),
+                                                 json.loads(new_outputs[platform]['output']))
+                delta['changed'].append(pair)
+
+    return delta
+
+def merge_snapshot(previous: Dict[str, Any], current: Dict[str, Any], full_scan: bool = True) -> Dict[str, Any]:
+    """Return the snapshot to record after deploying `current`.
+
+    A full scan replaces the previous snapshot; a partial one only updates
+    the agents it covered.
+    """
+    if full_scan:
+        return current
+    agents = dict(previous['agents'])
+    agents.update(current['agents'])
+    return {"version": SNAPSHOT_VERSION, "agents": agents}
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute the deployment delta against the last deployed build')
+    parser.add_argument('input_files', nargs='*',
+                        help='Agent configuration files (default: all agents in the repository; '
+                             'removals are only reported for the default full scan)')
+    parser.add_argument('--snapshot', required=True, help='Snapshot of the last deployed build (JSON)')
+    parser.add_argument('--output', help='Write the delta to this file instead of stdout')
+    parser.add_argument('--update-snapshot', action='store_true',
+                        help='Record the current build as deployed after computing the delta')
+
+    args = parser.parse_args()
+
+    try:
+        full_scan = not args.input_files
+        if args.input_files:
+            input_files = [Path(path) for path in args.input_files]
+        else:
+            from changed_agents import PROJECT_ROOT, all_agent_files
+            input_files = [PROJECT_ROOT / path for path in all_agent_files()]
+
+        previous = load_snapshot(args.snapshot)
+        current = build_snapshot(input_files, previous)
+        result = json.dumps(compute_delta(previous, current, full_scan), indent=2)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(result)
+            print(f"Deployment delta written to {args.output}")
+        else:
+            print(result)
+
+        if args.update_snapshot:
+            save_snapshot(merge_snapshot(previous, current, full_scan), args.snapshot)
+            print(f"Snapshot updated: {args.snapshot}", file=sys.stderr)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
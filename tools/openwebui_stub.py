@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Open WebUI Stub Server
+
+A local, in-memory stand-in for the Open WebUI model endpoints used by
+publish_open_webui.py, so publishing throughput and failure handling can be
+exercised without network access.
+
+Endpoints:
+    GET  /api/v1/models/model?id=<id>         200 with the stored model, or 404
+    POST /api/v1/models/create                store a new model (400 if it exists)
+    POST /api/v1/models/model/update?id=<id>  replace an existing model (404 if missing)
+    GET  /stub/stats                          request, connection and failure counters
+
+`--self-check` publishes a batch of models with publish_open_webui against an
+in-process stub with injected failures, and checks the stub's counters.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+class StubState:
+    """Models and counters shared by all request handlers."""
+
+    def __init__(self, token=None, fail_rate=0.0, latency=0.0):
+        self.token = token
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.models = {}
+        self.stats = {"requests": 0, "connections": 0, "injected_failures": 0, "created": 0, "updated": 0}
+        self.lock = threading.Lock()
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so clients can reuse connections
+    # Headers and body go out as separate writes; without TCP_NODELAY, Nagle plus
+    # the client's delayed ACK stalls every response on a reused connection
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.state.count('connections')
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _begin(self):
+        """Apply auth, latency and failure injection. Returns False if the request was answered."""
+        # Always consume the body so an early response leaves the connection reusable
+        length = int(self.headers.get('Content-Length', 0))
+        self.body = self.rfile.read(length) if length else b''
+
+        state = self.server.state
+        state.count('requests')
+        if state.latency:
+            time.sleep(state.latency)
+        if self.path.startswith('/stub/'):
+            return True
+        if state.token and self.headers.get('Authorization') != f"Bearer {state.token}":
+            self._send_json(401, {"detail": "Not authenticated"})
+            return False
+        if state.fail_rate and random.random() < state.fail_rate:
+            state.count('injected_failures')
+            self._send_json(503, {"detail": "Injected failure"})
+            return False
+        return True
+
+    def do_GET(self):
+        if not self._begin():
+            return
+        state = self.server.state
+        url = urlsplit(self.path)
+        if url.path == '/api/v1/models/model':
+            model_id = parse_qs(url.query).get('id', [''])[0]
+            with state.lock:
+                model = state.models.get(model_id)
+            if model is None:
+                self._send_json(404, {"detail": "Model not found"})
+            else:
+                self._send_json(200, model)
+        elif url.path == '/stub/stats':
+            with state.lock:
+                self._send_json(200, dict(state.stats, models=len(state.models)))
+        else:
+            self._send_json(404, {"detail": "Not found"})
+
+    def do_POST(self):
+        if not self._begin():
+            return
+        state = self.server.state
+        url = urlsplit(self.path)
+        model = json.loads(self.body or b'{}')
+        if url.path == '/api/v1/models/create':
+            with state.lock:
+                if model.get('id') in state.models:
+                    self._send_json(400, {"detail": "Model already exists"})
+                    return
+                state.models[model.get('id')] = model
+                state.stats['created'] += 1
+            self._send_json(200, model)
+        elif url.path == '/api/v1/models/model/update':
+            model_id = parse_qs(url.query).get('id', [''])[0]
+            with state.lock:
+                if model_id not in state.models:
+                    self._send_json(404, {"detail": "Model not found"})
+                    return
+                state.models[model_id] = model
+                state.stats['updated'] += 1
+            self._send_json(200, model)
+        else:
+            self._send_json(404, {"detail": "Not found"})
+
+def create_stub_server(host='127.0.0.1', port=0, **options):
+    """Build a stub server bound to (host, port); options are passed to StubState."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.state = StubState(**options)
+    return server
+
+def start_stub_server(host='127.0.0.1', port=0, **options):
+    """Start the stub server on a background thread and return it.
+
+    Use port 0 to pick a free port; the bound address is `server.server_address`.
+    Call `server.shutdown()` when done.
+    """
+    server = create_stub_server(host, port, **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def self_check(count=500, concurrency=16, fail_rate=0.1, latency=0.005):
+    """Publish `count` models through a failing stub twice and return a list of failed checks."""
+    from convert_agent import convert_to_open_webui, load_agent_config
+    from publish_open_webui import ConnectionPool, publish_configs
+
+    example = Path(__file__).parent.parent / 'examples' / 'code-reviewer-agent.yaml'
+    config = convert_to_open_webui(load_agent_config(str(example)))
+    configs = {f"agent-{index}": config for index in range(count)}
+
+    server = start_stub_server(fail_rate=fail_rate, latency=latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    stats_pool = ConnectionPool(url)
+    problems = []
+    try:
+        start = time.perf_counter()
+        first = publish_configs(url, configs, concurrency=concurrency, retries=8, backoff=0.01)
+        elapsed = time.perf_counter() - start
+        _, after_first = stats_pool.request('GET', '/stub/stats')
+        second = publish_configs(url, configs, concurrency=concurrency, retries=8, backoff=0.01)
+        _, stats = stats_pool.request('GET', '/stub/stats')
+
+        print(f"Published {count} models in {elapsed:.2f}s at concurrency {concurrency}")
+        print(f"Stub stats: {json.dumps(stats)}")
+
+        checks = [
+            (len(first['created']) == count and not first['failed'], "first run creates every model"),
+            (len(second['skipped']) == count and not second['failed'], "second run skips every model"),
+            (stats['models'] == count and stats['created'] == count, "stub stores each model once"),
+            (stats['updated'] == 0, "no updates for unchanged versions"),
+            (stats['injected_failures'] > 0, "injected failures were exercised"),
+            # GET + create, then GET, per model; one extra request per injected failure; two stats calls
+            (stats['requests'] == 3 * count + stats['injected_failures'] + 2,
+             "no requests beyond one retry per injected failure"),
+            # One connection for the stats pool, at most `concurrency` per publish run
+            (after_first['connections'] <= concurrency + 1
+             and stats['connections'] - after_first['connections'] <= concurrency,
+             "connections are pooled"),
+        ]
+        for ok, description in checks:
+            print(f"  {'✅' if ok else '❌'} {description}")
+            if not ok:
+                problems.append(description)
+    finally:
+        stats_pool.close()
+        server.shutdown()
+        server.server_close()
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local Open WebUI stub server for publish testing')
+    parser.add_argument('--host', default='127.0.0.1', help='Host to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to bind (default: 8080)')
+    parser.add_argument('--token', help='Require this bearer token')
+    parser.add_argument('--fail-rate', type=float, default=0.0, help='Fraction of API requests answered with 503')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to delay each request')
+    parser.add_argument('--self-check', action='store_true',
+                        help='Publish a batch of models through an in-process stub and check its counters')
+
+    args = parser.parse_args()
+
+    if args.self_check:
+        problems = self_check(fail_rate=args.fail_rate or 0.1, latency=args.latency or 0.005)
+        sys.exit(1 if problems else 0)
+
+    server = create_stub_server(args.host, args.port, token=args.token,
+                                fail_rate=args.fail_rate, latency=args.latency)
+    print(f"Open WebUI stub listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
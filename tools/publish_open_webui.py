@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Open WebUI Publisher
+
+Publishes converted Open WebUI model configs to an Open WebUI-compatible HTTP
+endpoint. Uploads run concurrently over a pool of keep-alive connections,
+transient failures are retried with exponential backoff, and agents whose
+remote version already matches are skipped.
+
+Test against the local stub server (no network needed):
+
+    python tools/openwebui_stub.py --port 8080 --fail-rate 0.1 &
+    python tools/publish_open_webui.py --url http://127.0.0.1:8080
+"""
+
+import argparse
+import http.client
+import json
+import os
+import queue
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from compile_agents import agent_name
+from convert_agent import convert_to_open_webui, load_agent_config
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class PublishError(Exception):
+    """Raised when a model cannot be published after all retries."""
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP(S) connections to a single host."""
+
+    def __init__(self, url: str, timeout: float = 10.0, headers: Optional[Dict[str, str]] = None):
+        parsed = urlsplit(url)
+        if parsed.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        self._connection_class = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._base_path = parsed.path.rstrip('/')
+        self._timeout = timeout
+        self._headers = headers or {}
+        self._idle = queue.LifoQueue()
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connection_class(self._host, self._port, timeout=self._timeout)
+
+    def request(self, method: str, path: str, body: Any = None) -> Tuple[int, Any]:
+        """Send a request and return (status, decoded JSON body or None)."""
+        headers = dict(self._headers, Accept='application/json')
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        connection = self._acquire()
+        try:
+            connection.request(method, self._base_path + path, body=data, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._idle.put(connection)
+
+        try:
+            return response.status, json.loads(payload) if payload else None
+        except ValueError:
+            return response.status, None
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+def request_with_retry(pool: ConnectionPool, method: str, path: str, body: Any = None,
+                       retries: int = 3, backoff: float = 0.5, ok_statuses=(200,)) -> Tuple[int, Any]:
+    """Send a request, retrying connection errors and retryable statuses with exponential backoff."""
+    for attempt in range(retries + 1):
+        try:
+            status, result = pool.request(method, path, body)
+            if status not in RETRY_STATUSES:
+                if status not in ok_statuses:
+                    raise PublishError(f"{method} {path} returned {status}: {result}")
+                return status, result
+            error = f"{method} {path} returned {status}"
+        except (OSError, http.client.HTTPException) as e:
+            error = f"{method} {path} failed: {e}"
+
+        if attempt < retries:
+            time.sleep(backoff * (2 ** attempt) * (0.5 + random.random()))
+
+    raise PublishError(f"{error} (after {retries + 1} attempts)")
+
+def publish_model(pool: ConnectionPool, model_id: str, config: Dict[str, Any], force: bool = False,
+                  retries: int = 3, backoff: float = 0.5) -> str:
+    """Create or update one model. Returns 'created', 'updated' or 'skipped'."""
+    model_path = f"/api/v1/models/model?id={quote(model_id)}"
+    status, remote = request_with_retry(pool, 'GET', model_path, retries=retries, backoff=backoff,
+                                        ok_statuses=(200, 404))
+
+    if status == 404:
+        # Create is not idempotent: a retried create whose first attempt landed, or a
+        # concurrent publisher, reports "already exists", so fall back to an update
+        status, _ = request_with_retry(pool, 'POST', '/api/v1/models/create', dict(config, id=model_id),
+                                       retries=retries, backoff=backoff, ok_statuses=(200, 400, 409))
+        if status == 200:
+            return 'created'
+    else:
+        remote_version = (remote or {}).get('metadata', {}).get('version')
+        if not force and remote_version == config['metadata']['version']:
+            return 'skipped'
+
+    request_with_retry(pool, 'POST', f"/api/v1/models/model/update?id={quote(model_id)}",
+                       dict(config, id=model_id), retries=retries, backoff=backoff)
+    return 'updated'
+
+def publish_all(url: str, input_files, token: Optional[str] = None, concurrency: int = 8,
+                retries: int = 3, backoff: float = 0.5, timeout: float = 10.0, force: bool = False) -> Dict[str, list]:
+    """Convert and publish agents concurrently, returning agent names grouped by outcome."""
+    configs = {}
+    for input_file in input_files:
+        name = agent_name(Path(input_file))
+        if name in configs:
+            raise ValueError(f"Duplicate agent name '{name}': {input_file}")
+        configs[name] = convert_to_open_webui(load_agent_config(str(input_file)))
+
+    return publish_configs(url, configs, token=token, concurrency=concurrency, retries=retries,
+                           backoff=backoff, timeout=timeout, force=force)
+
+def publish_configs(url: str, configs: Dict[str, Dict[str, Any]], token: Optional[str] = None,
+                    concurrency: int = 8, retries: int = 3, backoff: float = 0.5, timeout: float = 10.0,
+                    force: bool = False) -> Dict[str, list]:
+    """Publish already converted configs, keyed by model id, concurrently over one connection pool."""
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+    pool = ConnectionPool(url, timeout=timeout, headers=headers)
+    results = {'created': [], 'updated': [], 'skipped': [], 'failed': []}
+
+    def publish(name):
+        try:
+            return name, publish_model(pool, name, configs[name], force, retries, backoff), None
+        except (PublishError, OSError, http.client.HTTPException) as e:
+            return name, 'failed', e
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for name, outcome, error in executor.map(publish, sorted(configs)):
+                results[outcome].append(name)
+                if error:
+                    print(f"❌ {name}: {error}", file=sys.stderr)
+    finally:
+        pool.close()
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish agents to an Open WebUI-compatible endpoint')
+    parser.add_argument('input_files', nargs='*', help='Agent configuration files (default: all agents in the repository)')
+    parser.add_argument('--url', required=True, help='Open WebUI base URL, e.g. http://localhost:8080')
+    parser.add_argument('--token', default=os.environ.get('OPEN_WEBUI_TOKEN'),
+                        help='API token (default: $OPEN_WEBUI_TOKEN)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum concurrent uploads (default: 8)')
+    parser.add_argument('--retries', type=int, default=3, help='Retries per request on transient failures (default: 3)')
+    parser.add_argument('--backoff', type=float, default=0.5, help='Initial retry backoff in seconds (default: 0.5)')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds (default: 10)')
+    parser.add_argument('--force', action='store_true', help='Publish even when the remote version matches')
+
+    args = parser.parse_args()
+
+    try:
+        if args.input_files:
+            input_files = [Path(path) for path in args.input_files]
+        else:
+            from changed_agents import PROJECT_ROOT, all_agent_files
+            input_files = [PROJECT_ROOT / path for path in all_agent_files()]
+
+        start = time.perf_counter()
+        results = publish_all(args.url, input_files, token=args.token, concurrency=args.concurrency,
+                              retries=args.retries, backoff=args.backoff, timeout=args.timeout, force=args.force)
+        elapsed = time.perf_counter() - start
+
+        print(f"📡 Published to {args.url} in {elapsed:.2f}s")
+        for outcome in ('created', 'updated', 'skipped', 'failed'):
+            print(f"  {outcome.capitalize()}: {len(results[outcome])}")
+
+        if results['failed']:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ import argparse
 import sys
 from pathlib import Path
 
+from agent_rules import COMPATIBILITY, QUALITY, RuleEngine, load_rule_file
+
 def load_schema():
     """Load the JSON schema for agent validation."""
     schema_path = Path(__file__).parent.parent / "schemas" / "agent-schema.json"
@@ -38,121 +40,119 @@ def validate_agent(agent_config, schema):
 
 def check_platform_compatibility(agent_config):
     """Check platform-specific compatibility issues."""
-    warnings = []
-    agent = agent_config.get('agent', {})
-    
-    # Check character limits for different platforms
-    core = agent.get('core', {})
-    system_prompt = core.get('system_prompt', '')
+    return RuleEngine().run(agent_config)[COMPATIBILITY]
+
+def analyze_agent_quality(agent_config):
+    """Analyze agent configuration quality and provide suggestions."""
+    return RuleEngine().run(agent_config)[QUALITY]
+
+def report_agent(input_file: str, schema, engine: RuleEngine, args) -> bool:
+    """Validate a single agent file and print its report. Returns False on a strict failure."""
+    agent_config = load_agent_config(input_file)
     
-    # GitHub Copilot limits
-    if len(system_prompt) > 1500:
-        warnings.append("GitHub Copilot: System prompt may be too long (>1500 chars)")
+    # Validate against schema
+    is_valid, errors = validate_agent(agent_config, schema)
     
-    # ChatGPT limits
-    if len(system_prompt) > 1200:
-        warnings.append("ChatGPT: System prompt may be too long for custom instructions (>1200 chars)")
+    print(f"Validating: {input_file}")
+    print("=" * 50)
     
-    # Check for required platform configurations
-    platforms = agent.get('platforms', {})
-    for platform_name, config in platforms.items():
-        if config.get('enabled', False):
-            if not config.get('custom_instructions'):
-                warnings.append(f"{platform_name}: Enabled but no custom_instructions provided")
+    if is_valid:
+        print("✅ Schema validation: PASSED")
+    else:
+        print("❌ Schema validation: FAILED")
+        for error in errors:
+            print(f"  - {error}")
+        if args.strict:
+            return False
     
-    return warnings
-
-def analyze_agent_quality(agent_config):
-    """Analyze agent configuration quality and provide suggestions."""
-    suggestions = []
-    agent = agent_config.get('agent', {})
+    # Compatibility and quality rules share a single pass over the config
+    results = engine.run(agent_config)
     
-    # Check metadata completeness
-    metadata = agent.get('metadata', {})
-    if not metadata.get('author'):
-        suggestions.append("Consider adding author information in metadata")
-    if not metadata.get('tags'):
-        suggestions.append("Consider adding tags for better categorization")
+    # Platform compatibility check
+    if args.check_compatibility or not args.strict:
+        warnings = results[COMPATIBILITY]
+        if warnings:
+            print("\n⚠️  Platform Compatibility Warnings:")
+            for warning in warnings:
+                print(f"  - {warning}")
+        else:
+            print("\n✅ Platform compatibility: OK")
     
-    # Check core configuration
-    core = agent.get('core', {})
-    if not core.get('expertise'):
-        suggestions.append("Consider defining expertise areas for better context")
-    if not core.get('constraints'):
-        suggestions.append("Consider defining constraints to guide agent behavior")
+    # Quality analysis
+    if args.analyze_quality or not args.strict:
+        suggestions = results[QUALITY]
+        if suggestions:
+            print("\n💡 Quality Suggestions:")
+            for suggestion in suggestions:
+                print(f"  - {suggestion}")
+        else:
+            print("\n✅ Configuration quality: Excellent")
     
-    # Check examples
-    if not agent.get('examples'):
-        suggestions.append("Consider adding examples to demonstrate expected behavior")
+    # Summary
+    agent = agent_config.get('agent', {})
+    metadata = agent.get('metadata', {})
+    platforms = agent.get('platforms', {})
+    enabled_platforms = [name for name, config in platforms.items() if config.get('enabled', False)]
     
-    # Check safety considerations
-    if not agent.get('safety'):
-        suggestions.append("Consider adding safety guidelines and considerations")
+    print(f"\n📊 Summary:")
+    print(f"  Agent: {metadata.get('name', 'Unknown')}")
+    print(f"  Version: {metadata.get('version', 'Unknown')}")
+    print(f"  Enabled Platforms: {', '.join(enabled_platforms) if enabled_platforms else 'None'}")
     
-    return suggestions
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description='Validate generic agent configurations')
-    parser.add_argument('input_file', help='Input agent configuration file (YAML or JSON)')
+    parser.add_argument('input_file', nargs='?', help='Input agent configuration file (YAML or JSON)')
+    parser.add_argument('--since', metavar='REF',
+                        help='Validate only agents changed since this git ref (all agents if the schema or rules changed)')
     parser.add_argument('--strict', action='store_true', help='Strict validation mode')
     parser.add_argument('--check-compatibility', action='store_true', help='Check platform compatibility')
     parser.add_argument('--analyze-quality', action='store_true', help='Analyze configuration quality')
+    parser.add_argument('--rules', action='append', default=[], metavar='FILE',
+                        help='Python file with additional @rule checks (repeatable)')
+    parser.add_argument('--rule-timing', action='store_true', help='Report time spent in each rule')
     
     args = parser.parse_args()
+    if bool(args.input_file) == bool(args.since):
+        parser.error('provide either input_file or --since')
     
+    current_file = args.input_file
     try:
-        # Load schema and agent config
+        # Load schema and rules once and work out which agents to validate
         schema = load_schema()
-        agent_config = load_agent_config(args.input_file)
-        
-        # Validate against schema
-        is_valid, errors = validate_agent(agent_config, schema)
-        
-        print(f"Validating: {args.input_file}")
-        print("=" * 50)
-        
-        if is_valid:
-            print("✅ Schema validation: PASSED")
+        for rule_file in args.rules:
+            load_rule_file(rule_file)
+        engine = RuleEngine()
+        if args.since:
+            from changed_agents import SCHEMA_DEPENDENCIES, agents_to_process, repo_path
+            # Custom rule files affect every agent's report, like the schema does
+            rule_paths = [repo_path(rule_file) for rule_file in args.rules]
+            dependencies = SCHEMA_DEPENDENCIES + tuple(path for path in rule_paths if path)
+            input_files = [str(path) for path in agents_to_process(args.since, dependencies)]
+            if not input_files:
+                print(f"No agent changes since {args.since}")
+                return
         else:
-            print("❌ Schema validation: FAILED")
-            for error in errors:
-                print(f"  - {error}")
-            if args.strict:
-                sys.exit(1)
-        
-        # Platform compatibility check
-        if args.check_compatibility or not args.strict:
-            warnings = check_platform_compatibility(agent_config)
-            if warnings:
-                print("\n⚠️  Platform Compatibility Warnings:")
-                for warning in warnings:
-                    print(f"  - {warning}")
-            else:
-                print("\n✅ Platform compatibility: OK")
+            input_files = [args.input_file]
         
-        # Quality analysis
-        if args.analyze_quality or not args.strict:
-            suggestions = analyze_agent_quality(agent_config)
-            if suggestions:
-                print("\n💡 Quality Suggestions:")
-                for suggestion in suggestions:
-                    print(f"  - {suggestion}")
-            else:
-                print("\n✅ Configuration quality: Excellent")
+        failed = False
+        for index, current_file in enumerate(input_files):
+            if index:
+                print()
+            if not report_agent(current_file, schema, engine, args):
+                failed = True
         
-        # Summary
-        agent = agent_config.get('agent', {})
-        metadata = agent.get('metadata', {})
-        platforms = agent.get('platforms', {})
-        enabled_platforms = [name for name, config in platforms.items() if config.get('enabled', False)]
+        if args.rule_timing:
+            print(f"\n⏱️  Rule Timing ({len(input_files)} agents):")
+            for name, seconds in sorted(engine.timings.items(), key=lambda item: -item[1]):
+                print(f"  - {name}: {seconds * 1000:.3f} ms")
         
-        print(f"\n📊 Summary:")
-        print(f"  Agent: {metadata.get('name', 'Unknown')}")
-        print(f"  Version: {metadata.get('version', 'Unknown')}")
-        print(f"  Enabled Platforms: {', '.join(enabled_platforms) if enabled_platforms else 'None'}")
+        if failed:
+            sys.exit(1)
         
     except FileNotFoundError:
-        print(f"Error: File {args.input_file} not found", file=sys.stderr)
+        print(f"Error: File {current_file} not found", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)